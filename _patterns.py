@@ -0,0 +1,149 @@
+"""
+Precompiled regex patterns, translation tables, and compile helpers shared by
+the extractor. Every extractor runs the same handful of patterns once per
+mission; compiling them a single time at import skips the re module's
+per-call cache lookup and pattern re-parse on the hot parsing path, and
+keeping them in one module keeps main.py focused on the parsing logic.
+"""
+
+import re
+from functools import lru_cache
+
+# google-re2 matches in guaranteed linear time with no backtracking, which
+# pays off on the big alternation patterns below. It is optional;
+# patterns fall back to the stdlib engine when it is not installed or when it
+# cannot handle a particular expression.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def _compile_heavy(pattern, flags=0):
+    """Compile a backtracking-prone pattern through re2 when available."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, flags)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+# Generic whitespace normalizers.
+_RE_SPACETAB = re.compile(r'[ \t]+')
+_RE_NL3 = re.compile(r'\n{3,}')
+_RE_NONSPACE = re.compile(r'\S')
+_RE_NL_WS = re.compile(r'\s*\n\s*')
+
+# One token per table-of-contents item: either a section sentinel (group 1) or
+# a "NAME page" entry (groups 2 and 3). Sentinels are tried first so section
+# headers are never consumed as entries. IGNORECASE is scoped to the
+# sentinels; entry names must stay uppercase as they always were, or
+# lowercase prose inside a section would parse as mission entries.
+_RE_TOC_TOKEN = re.compile(r'((?i:ITS SCENARIOS|ITS DIRECT ACTION|RESILIENCE OPERATIONS|CHANGELOG))|([A-Z][A-Z\s\-]+?)\s+(\d+)')
+
+# Season and version metadata parsed from the PDF file name (see
+# run_extraction).
+_RE_SEASON = re.compile(r'(season[_\-\s]?\d{1,2})', re.IGNORECASE)
+_RE_VERSION = re.compile(r'v(\d+\.\d+\.\d+)', re.IGNORECASE)
+
+# Mission header fields.
+_RE_TACTICAL = re.compile(r'TACTICAL\s+SUPPORT\s+OPTIONS\s+(\d+)', re.IGNORECASE)
+_RE_REINFORCEMENTS = re.compile(r'SUITABLE\s+FOR\s+REINFORCEMENTS\s+(YES|NO)', re.IGNORECASE)
+
+# The "MISSION OBJECTIVES" section: everything up to the next major section header.
+_RE_OBJ_SECTION = re.compile(r'MISSION\s+OBJECTIVES\s+(.*?)(?:FORCES\s+AND\s+DEPLOYMENT|SCENARIO\s+SPECIAL|TACTICAL\s+SUPPORT\s+OPTIONS)', re.DOTALL | re.IGNORECASE)
+# Objective-points tables by game size: a header run of "N-point game" columns
+# ending in "objective points", followed by the run of body cells.
+_RE_OBJ_TABLE = _compile_heavy(r'((?:\d+-point game\s+)+objective\s+points\s+)((?:to\s+kill\s+(?:(?:at\s+least|\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+enemy\s+army\s+points|the\s+enemy\s+Lieutenant)\.+?\s+|If\s+you\s+have\s+(?:\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+surviving\s+victory points?\.+\s+|\d+\s+objective\s+points?\.+\s+)+)', re.IGNORECASE | re.MULTILINE)
+_RE_TABLE_HEADER_CELL = re.compile(r'(\d+-point game|objective\s+points)', re.IGNORECASE)
+_RE_TABLE_BODY_CELL = re.compile(r'(to\s+kill\s+(?:(?:at\s+least|\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+enemy\s+army\s+points|the\s+enemy\s+Lieutenant)\.+?\s+|If\s+you\s+have\s+(?:\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+surviving\s+victory points?\.+\s+|\d+\s+objective\s+points?\.+\s+)', re.IGNORECASE)
+# Objectives are bullet points separated by '^' markers.
+_RE_OBJ_SPLIT = re.compile(r'\n\s*\^\s*')
+_RE_LEAD_CARET = re.compile(r'^\^\s*')
+
+# The "SCENARIO SPECIAL RULES" section: everything to the end of the mission text.
+_RE_RULES_SECTION = re.compile(r'SCENARIO\s+SPECIAL\s+RULES\s+(.*)', re.DOTALL | re.IGNORECASE)
+
+# The "END OF THE MISSION" header.
+_RE_EOM_HEADER = re.compile(r'END\s+OF\s+THE\s+MISSION')
+
+# Every major section header in one alternation, used by _locate_sections to
+# find all section starts in a single scan of the mission text.
+_RE_SECTION_HEADER = re.compile(r'MISSION\s+OBJECTIVES|FORCES\s+AND\s+DEPLOYMENT|SCENARIO\s+SPECIAL\s+RULES|END\s+OF\s+(?:THE\s+)?MISSION|TACTICAL\s+SUPPORT\s+OPTIONS|SUITABLE\s+FOR\s+REINFORCEMENTS', re.IGNORECASE)
+
+# The "FORCES AND DEPLOYMENT" section and its contents.
+_RE_DEPLOY_SECTION = re.compile(r'FORCES\s+AND\s+DEPLOYMENT\s+(.*?)(?:SCENARIO\s+SPECIAL\s+RULES|LAUNCHING\s+TOWER|SERVER\s+ROOM|QUADRANTS)', re.DOTALL | re.IGNORECASE)
+# Army points table rows: points, SWC, table size, and a rectangular or radial
+# deployment zone.
+_RE_ARMY_CFG = _compile_heavy(r'A\s+and\s+B\s+(\d{3,4})\s+(\d+)\s+(\d+\s+in\s+x\s+\d+\s+in)\s+((?:\d+\s+in\s+x\s+\d+\s+in(?:\s+Central\s+Strip\s+zone:\s+\d+\s+in\s+x\s+\d+\s+in)?)|(?:Radius of\s+\d+\s+in))', re.IGNORECASE)
+# Special deployment notes: sentences starting "It is (not) allowed/permitted..."
+# or "Exclusion Zone...".
+_RE_DEPLOY_NOTES = _compile_heavy(r'(?:It\s+is\s+(?:not\s+)?(?:allowed|permitted)[^.]+\.|Exclusion\s+Zone[^.]+\.)', re.IGNORECASE)
+
+# Headers that are known to be subsections of a rule (e.g., for skills) or
+# other markers that should never start a new rule. Built once as a frozenset
+# so membership tests in the header scan are constant-time with no per-call
+# set construction.
+_SUBSECTION_HEADERS = frozenset({'SHORT SKILL', 'SHORT MOVEMENT SKILL', 'LONG SKILL', 'REQUIREMENTS', 'EFFECTS', 'CANCELATION'})
+
+# Headers that close out the rules section rather than naming a rule.
+_END_HEADERS = frozenset({'END OF THE MISSION', 'END OF MISSION'})
+
+# Skill rule sections (see parse_skill_rule). Each captures its section's body
+# up to the next known section, a fresh all-caps header, or end of text.
+# Skill sections are located by header, then sliced up to the earliest of
+# their terminator patterns (see parse_skill_rule). Lazy .*? captures guarded
+# by terminator lookaheads would re-test the terminators at every character of
+# a section; plain forward searches visit each character once. IGNORECASE is
+# kept where it changes what the replaced expressions matched; CANCELATION
+# only ever appears uppercase in the season documents, so its patterns run
+# case-sensitive, which lets the engine use a plain literal scan.
+_RE_SKILL_TYPE_HEADER = re.compile(r'(SHORT|LONG)\s+SKILL[ \t]*\n', re.IGNORECASE)
+_RE_REQ_HEADER = re.compile(r'REQUIREMENTS[ \t]*\n', re.IGNORECASE)
+_RE_EFF_HEADER = re.compile(r'EFFECTS[ \t]*\n', re.IGNORECASE)
+_RE_CANCEL_HEADER = re.compile(r'CANCELATION[ \t]*\n')
+_RE_NL_REQ = re.compile(r'\nREQUIREMENTS', re.IGNORECASE)
+_RE_NL_EFF = re.compile(r'\nEFFECTS', re.IGNORECASE)
+_RE_NL_CANCEL = re.compile(r'\nCANCELATION')
+_RE_NL_SKILL = re.compile(r'\n(?:SHORT|LONG)\s+SKILL', re.IGNORECASE)
+_RE_LETTER_LINE = re.compile(r'\n[A-Z][A-Z\s]+\n', re.IGNORECASE)
+# Detector for rules that are structured skills rather than plain text.
+_RE_SKILL_TAG = re.compile(r'(SHORT( MOVEMENT)?|LONG)\s+SKILL')
+
+# One fused pass over skill section text: a newline-adjacent ► bullet
+# (group 1) or any other whitespace run (group 2), dispatched by callback.
+# Group 1 swallows leading whitespace so a space run ahead of a bullet cannot
+# be claimed by the plain collapse, which would strand the newline test.
+_RE_SKILL_CLEAN = re.compile(r'(\s*\n\s*►\s*)|(\s+)')
+
+# Candidate rule headers: lines consisting entirely of uppercase letters,
+# whitespace, and limited punctuation (see extract_special_rules).
+_RE_RULE_HEADER = _compile_heavy(r'^([A-Z][A-Z \t\-\(\)\/:]*)[ \t]*$', re.MULTILINE)
+# Same idea for the header terminating the END OF THE MISSION text, which must
+# also end with an uppercase letter.
+_RE_NEXT_HEADER = re.compile(r'^\s*([A-Z][A-Z \t\-\(\)\/]*[A-Z])[ \t]*$', re.MULTILINE)
+
+# Delete-only tables used to count cased characters by length difference
+# (see the subsection header heuristic in extract_objectives).
+_DEL_UPPER = str.maketrans('', '', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_DEL_LOWER = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyz')
+
+# Newlines and periods deleted from objective table cells.
+_TABLE_CELL_TRANSLATION = str.maketrans('', '', '\n.')
+
+# Invisible characters scrubbed from skill section text: punctuation space,
+# zero-width spaces/joiners, and a stray BOM. Deleting them through one
+# translate table costs a single pass regardless of how many are listed.
+_INVISIBLE_CHARS = str.maketrans('', '', '\u2008\u200b\u200c\u200d\ufeff')
+
+# Single-pass character mapping for sanitize_header_key: spaces, dashes and
+# slashes become underscores, parentheses are dropped.
+_KEY_TRANSLATION = str.maketrans({' ': '_', '-': '_', '/': '_', '(': None, ')': None})
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern, flags=0):
+    """
+    Compile a dynamically built pattern, memoized. The re module has its own
+    internal cache, but going through it still re-hashes the pattern string
+    and flags on every call; caching the compiled object here skips that.
+    """
+    return re.compile(pattern, flags)
@@ -1,70 +1,151 @@
 #! .venv/bin/python3
 
-import pymupdf  # PyMuPDF
 import json
 import re
 import click
+
+from _patterns import (
+    _RE_SPACETAB, _RE_NL3, _RE_NONSPACE, _RE_NL_WS,
+    _RE_TOC_TOKEN, _RE_SEASON, _RE_VERSION,
+    _RE_TACTICAL, _RE_REINFORCEMENTS,
+    _RE_OBJ_SECTION, _RE_OBJ_TABLE, _RE_TABLE_HEADER_CELL,
+    _RE_TABLE_BODY_CELL, _RE_OBJ_SPLIT, _RE_LEAD_CARET,
+    _RE_RULES_SECTION, _RE_EOM_HEADER, _RE_SECTION_HEADER,
+    _RE_DEPLOY_SECTION, _RE_ARMY_CFG, _RE_DEPLOY_NOTES,
+    _SUBSECTION_HEADERS, _END_HEADERS,
+    _RE_SKILL_TYPE_HEADER, _RE_REQ_HEADER, _RE_EFF_HEADER, _RE_CANCEL_HEADER,
+    _RE_NL_REQ, _RE_NL_EFF, _RE_NL_CANCEL, _RE_NL_SKILL, _RE_LETTER_LINE,
+    _RE_SKILL_TAG, _RE_SKILL_CLEAN,
+    _RE_RULE_HEADER, _RE_NEXT_HEADER,
+    _DEL_UPPER, _DEL_LOWER, _TABLE_CELL_TRANSLATION,
+    _INVISIBLE_CHARS, _KEY_TRANSLATION,
+    _compile_pattern,
+)
+
+# orjson serializes a mission several times faster than the stdlib encoder.
+# It is optional: when it is not installed the stdlib json module is used and
+# the output is byte-identical either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from functools import lru_cache
 from rich.console import Console
-from rich.table import Table
-from rich.pretty import pprint
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 console = Console()
 
+@lru_cache(maxsize=512)
+def sanitize_header_key(header):
+    """
+    Convert a section header into a JSON-friendly key. The same handful of
+    headers recur across every mission in a document, so the result is cached
+    and the character substitutions run as one translate pass instead of a
+    chain of replace calls.
+    """
+    return header.lower().translate(_KEY_TRANSLATION)
+
+def _get_page_text(doc, page_num, cache=None):
+    """
+    Extract a page's text, reusing a previously extracted copy when a cache
+    dict is provided. Text extraction is the dominant MuPDF cost, so pages
+    touched by more than one step (the raw dump, the terminator search, and
+    mission extraction) should only pay for it once per run.
+    """
+    if cache is None:
+        return doc[page_num].get_text()
+    text = cache.get(page_num)
+    if text is None:
+        text = doc[page_num].get_text()
+        cache[page_num] = text
+    return text
+
+def _extract_and_parse_mission(args):
+    """
+    Process-pool worker: extract and parse a single mission. MuPDF document
+    handles cannot be shared across processes, so each worker opens its own
+    handle from the file path.
+    """
+    import pymupdf  # deferred: only needed once real extraction starts
+    pdf_path, name, start_page, end_page, is_direct_action = args
+    doc = pymupdf.open(pdf_path)
+    try:
+        mission_text = extract_text_from_pages(doc, start_page, end_page, name=name)
+    finally:
+        doc.close()
+    return parse_mission(name, mission_text, is_direct_action=is_direct_action)
+
 def extract_missions_from_pdf(pdf_path, debug=False, raw=False, slow=False):
     """
     Main function to orchestrate the extraction of ITS Scenarios and Direct Action 
     scenarios from the provided PDF file. It reads the table of contents, then 
     iterates through each identified mission, extracting and parsing the text
-    from the relevant pages.
+    from the relevant pages. Missions are yielded one at a time so the caller
+    can stream them out instead of holding the whole season in memory.
     """
+    # PyMuPDF is the slowest import in the dependency set; defer it so that
+    # --help and argument errors never pay for loading the MuPDF bindings.
+    import pymupdf
     doc = pymupdf.open(pdf_path)
-    
+
+    # Pages get touched by several steps (raw dump, terminator search, mission
+    # extraction); cache their extracted text so each page is only parsed once.
+    page_text_cache = {}
+
+    # len(doc) asks MuPDF for the page count on every call; read it once.
+    page_count = len(doc)
+
     # The table of contents is consistently on the second page (index 1) of the PDF.
     # This page is crucial for locating the missions.
-    toc_page = doc[1]
-    toc_text = toc_page.get_text()
-    
+    toc_text = _get_page_text(doc, 1, page_text_cache)
+
     if debug:
         console.print(f"\n[cyan]Table of Contents has {len(toc_text)} characters[/cyan]")
 
     if raw:
         output_txt_path = pdf_path.replace('.pdf', '.txt')
-        with open(output_txt_path, 'w', encoding='utf-8') as f:
-            text = ""
-            for i in range(len(doc)):
-                text += doc[i].get_text() # type: ignore
-            f.write(text)
+        with open(output_txt_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            # Write each page as it is extracted instead of materializing the
+            # whole document in memory first; peak usage stays at one page.
+            # This also pre-populates the page cache for the mission loops below.
+            for i in range(page_count):
+                f.write(_get_page_text(doc, i, page_text_cache))
     
     # Parse the raw text of the table of contents to get a structured list of
     # mission names and the pages they start on.
     its_scenarios, direct_actions = parse_table_of_contents(toc_text, debug)
     
-    # For clarity, print the parsed TOC data in formatted tables.
-    console.print("\n[bold green]ITS Scenarios found in TOC:[/bold green]")
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Name", style="cyan")
-    table.add_column("Page", style="yellow")
-    for scenario in its_scenarios:
-        table.add_row(scenario["name"], str(scenario["page"]))
-    console.print(table)
-    
-    console.print("\n[bold green]Direct Actions found in TOC:[/bold green]")
-    table2 = Table(show_header=True, header_style="bold magenta")
-    table2.add_column("Name", style="cyan")
-    table2.add_column("Page", style="yellow")
-    for action in direct_actions:
-        table2.add_row(action["name"], str(action["page"]))
-    console.print(table2)
-    
-    missions = []
-    
-    # Process each ITS Scenario found in the table of contents.
+    # The formatted TOC tables are diagnostic output; rendering them through
+    # rich costs real time on every run, so they are debug-only.
+    if debug:
+        from rich.table import Table
+        console.print("\n[bold green]ITS Scenarios found in TOC:[/bold green]")
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Name", style="cyan")
+        table.add_column("Page", style="yellow")
+        for scenario in its_scenarios:
+            table.add_row(scenario["name"], str(scenario["page"]))
+        console.print(table)
+        
+        console.print("\n[bold green]Direct Actions found in TOC:[/bold green]")
+        table2 = Table(show_header=True, header_style="bold magenta")
+        table2.add_column("Name", style="cyan")
+        table2.add_column("Page", style="yellow")
+        for action in direct_actions:
+            table2.add_row(action["name"], str(action["page"]))
+        console.print(table2)
+    
+    # Build a flat work list of (name, start_page, end_page, is_direct_action)
+    # records so both mission types flow through a single extraction path.
+    tasks = []
+
+    # Queue each ITS Scenario found in the table of contents.
     for i, scenario_info in enumerate(its_scenarios):
-        scenario_name = scenario_info["name"]
         start_page = scenario_info["page"] - 1  # Convert page number to 0-based index.
-        
+
         # Determine the end page for the current scenario. This is typically the page
         # before the next scenario starts.
         if i + 1 < len(its_scenarios):
@@ -75,70 +156,81 @@ def extract_missions_from_pdf(pdf_path, debug=False, raw=False, slow=False):
                 end_page = direct_actions[0]["page"] - 1
             else:
                 # If no Direct Actions, it runs to the end of the document.
-                end_page = len(doc)
-        
-        console.print(f"\n[bold blue]Extracting ITS Scenario:[/bold blue] [yellow]{scenario_name}[/yellow]")
-        console.print(f"  [cyan]Pages: {start_page + 1} to {end_page}[/cyan]")
-        
-        # Extract all text from the calculated page range for this scenario.
-        scenario_text = extract_text_from_pages(doc, start_page, end_page, debug=debug, name=scenario_name)
+                end_page = page_count
 
-        if raw:
-            os.makedirs("raw_text", exist_ok=True)
-            with open(f"raw_text/{scenario_name}.txt", "w", encoding="utf-8") as f:
-                f.write(scenario_text)
-        
-        if debug:
-            console.print(f"  [green]Extracted {len(scenario_text)} characters[/green]")
-            preview = scenario_text[:300] if len(scenario_text) > 300 else scenario_text
-            console.print(f"  [dim]Preview: {preview}...[/dim]")
-        
-        # Parse the extracted text to get structured data for the scenario.
-        scenario_data = parse_mission(scenario_name, scenario_text, debug=debug)
-        missions.append(scenario_data)
-        if slow:
-            time.sleep(1)  # Small delay to avoid overwhelming the console.
-    
-    # Process each Direct Action scenario similarly.
+        tasks.append((scenario_info["name"], start_page, end_page, False))
+
+    # Queue each Direct Action scenario similarly.
     for i, da_info in enumerate(direct_actions):
-        da_name = da_info["name"]
         start_page = da_info["page"] - 1  # Convert to 0-indexed
-        
+
         # Determine the end page for the current Direct Action.
         if i + 1 < len(direct_actions):
             end_page = direct_actions[i + 1]["page"] - 1
         else:
             # The last Direct Action ends at the "RESILIENCE OPERATIONS" section,
             # which we have to find manually as it's not in the TOC mission list.
-            end_page = find_page_with_text(doc, "RESILIENCE OPERATIONS", start_page)
+            end_page = find_page_with_text(doc, "RESILIENCE OPERATIONS", start_page, cache=page_text_cache)
             if end_page == -1:
-                end_page = len(doc) # Fallback to the end of the document.
-        
-        console.print(f"\n[bold blue]Extracting Direct Action:[/bold blue] [yellow]{da_name}[/yellow]")
-        console.print(f"  [cyan]Pages: {start_page + 1} to {end_page}[/cyan]")
-        
-        # Extract text from the determined page range.
-        da_text = extract_text_from_pages(doc, start_page, end_page, debug=debug, name=da_name)
-        
-        if raw:
-            os.makedirs("raw_text", exist_ok=True)
-            with open(f"raw_text/{da_name}.txt", "w", encoding="utf-8") as f:
-                f.write(da_text)
+                end_page = page_count # Fallback to the end of the document.
+
+        tasks.append((da_info["name"], start_page, end_page, True))
+
+    # Each mission is an independent page range, so the MuPDF extraction and
+    # regex parsing can fan out to a small process pool on plain batch runs.
+    # Debug, raw, and slow runs stay serial so their console output and file
+    # side effects keep their usual order.
+    if len(tasks) >= 2 and not (debug or raw or slow):
+        worker_args = [(pdf_path, name, start_page, end_page, is_da)
+                       for name, start_page, end_page, is_da in tasks]
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4)) as pool:
+            for (name, _, _, is_da), mission in zip(tasks, pool.map(_extract_and_parse_mission, worker_args)):
+                label = "Direct Action" if is_da else "ITS Scenario"
+                console.print(f"\n[bold blue]Extracted {label}:[/bold blue] [yellow]{name}[/yellow]")
+                yield mission
+    else:
+        # Pull every page the queued missions need into the cache in one
+        # ascending pass before parsing starts. Pages are read exactly once
+        # even when adjacent missions share a boundary page, and walking the
+        # document in page order is the access pattern MuPDF serves best.
+        needed_pages = {page_num
+                        for _, start_page, end_page, _ in tasks
+                        for page_num in range(start_page, min(end_page, page_count))}
+        for page_num in sorted(needed_pages):
+            _get_page_text(doc, page_num, page_text_cache)
+
+        for name, start_page, end_page, is_direct_action in tasks:
+            label = "Direct Action" if is_direct_action else "ITS Scenario"
+            console.print(f"\n[bold blue]Extracting {label}:[/bold blue] [yellow]{name}[/yellow]")
+            if debug:
+                console.print(f"  [cyan]Pages: {start_page + 1} to {end_page}[/cyan]")
+
+            # Extract all text from the calculated page range for this mission.
+            mission_text = extract_text_from_pages(doc, start_page, end_page, debug=debug, name=name, cache=page_text_cache)
+
+            if raw:
+                os.makedirs("raw_text", exist_ok=True)
+                with open(f"raw_text/{name}.txt", "w", encoding="utf-8") as f:
+                    f.write(mission_text)
+
+            if debug:
+                console.print(f"  [green]Extracted {len(mission_text)} characters[/green]")
+                # Slicing is a no-op when the text is already short, so no length check needed.
+                preview = mission_text[:300]
+                console.print(f"  [dim]Preview: {preview}...[/dim]")
+
+            # Parse the extracted text to get structured data for the mission.
+            yield parse_mission(name, mission_text, is_direct_action=is_direct_action, debug=debug)
+
+            # The extracted text lives on in page_text_cache, so MuPDF's own
+            # cached page resources (fonts, images, display lists) for this
+            # mission's pages are dead weight from here on; trim the store so
+            # serial runs over large documents keep a flat memory profile.
+            pymupdf.TOOLS.store_shrink(100)
+            if slow:
+                time.sleep(1)  # Small delay to avoid overwhelming the console.
 
-        if debug:
-            console.print(f"  [green]Extracted {len(da_text)} characters[/green]")
-            preview = da_text[:300] if len(da_text) > 300 else da_text
-            console.print(f"  [dim]Preview: {preview}...[/dim]")
-        
-        # Parse the text, flagging it as a Direct Action.
-        da_data = parse_mission(da_name, da_text, is_direct_action=True, debug=debug)
-        missions.append(da_data)
-        if slow:
-            time.sleep(1)  # Small delay to avoid overwhelming the console.
-    
     doc.close()
-    
-    return missions
 
 def parse_table_of_contents(toc_text, debug=False):
     """
@@ -148,95 +240,111 @@ def parse_table_of_contents(toc_text, debug=False):
     its_scenarios = []
     direct_actions = []
     
-    # Normalize the TOC text by replacing any sequence of one or more whitespace
-    # characters (spaces, tabs, newlines) with a single space. This simplifies
-    # subsequent regex matching.
-    toc_normalized = re.sub(r'\s+', ' ', toc_text)
-    
-    # Regex to find the "ITS SCENARIOS" section. It captures the content between
-    # "ITS SCENARIOS" and "ITS DIRECT ACTION".
-    # - `ITS SCENARIOS\s+(\d+)\s+`: Matches "ITS SCENARIOS", whitespace, a page number (ignored), and more whitespace.
-    # - `(.*?)`: Non-greedily captures all characters (the scenario list).
-    # - `\s+ITS DIRECT ACTION`: Matches the text that marks the end of the section.
-    its_match = re.search(r'ITS SCENARIOS\s+(\d+)\s+(.*?)\s+ITS DIRECT ACTION', toc_normalized, re.IGNORECASE)
-    if its_match:
-        scenarios_section = its_match.group(2)
-        if debug:
-            console.print(f"\n[dim]ITS Scenarios section: {scenarios_section[:200]}...[/dim]")
-        
-        # Regex to find all scenario names and their corresponding page numbers.
-        # - `([A-Z][A-Z\s\-]+?)`: Captures a scenario name. It must start with an uppercase letter
-        #   and can contain other uppercase letters, spaces, or hyphens. The `+?` is non-greedy.
-        # - `\s+`: Matches the space(s) between the name and the page number.
-        # - `(\d+)`: Captures the page number.
-        scenario_matches = re.findall(r'([A-Z][A-Z\s\-]+?)\s+(\d+)', scenarios_section)
-        for name, page in scenario_matches:
-            name = name.strip()
-            # Filter out known non-scenario headers that might be accidentally matched.
-            if len(name) > 3 and name not in ['ITS SCENARIOS', 'EXTRAS', 'CLASSIFIED OBJECTIVES']:
-                its_scenarios.append({"name": name, "page": int(page)})
-    
-    # Regex to find the "ITS DIRECT ACTION" section. It captures content between
-    # "ITS DIRECT ACTION" and either "RESILIENCE OPERATIONS" or "CHANGELOG".
-    # - `ITS DIRECT ACTION\s+(\d+)\s+`: Matches the section header and its page number.
-    # - `(.*?)`: Non-greedily captures the list of direct actions.
-    # - `(?:RESILIENCE OPERATIONS|CHANGELOG)`: A non-capturing group that marks the end of the section.
-    da_match = re.search(r'ITS DIRECT ACTION\s+(\d+)\s+(.*?)(?:RESILIENCE OPERATIONS|CHANGELOG)', toc_normalized, re.IGNORECASE)
-    if da_match:
-        da_section = da_match.group(2)
-        if debug:
-            console.print(f"\n[dim]Direct Action section: {da_section[:200]}...[/dim]")
-        
-        # Uses the same pattern as above to extract action names and page numbers.
-        da_matches = re.findall(r'([A-Z][A-Z\s\-]+?)\s+(\d+)', da_section)
-        for name, page in da_matches:
-            name = name.strip()
-            if len(name) > 3:
-                direct_actions.append({"name": name, "page": int(page)})
-    
+    # Normalize the TOC text by collapsing any sequence of whitespace
+    # characters (spaces, tabs, newlines) into a single space. This simplifies
+    # subsequent regex matching; whitespace-mode str.split does the collapse
+    # in one C-level pass.
+    toc_normalized = ' '.join(toc_text.split())
+
+    # Walk the normalized TOC once. Section sentinels switch which list entries
+    # are collected into ("ITS SCENARIOS" / "ITS DIRECT ACTION" open a section,
+    # "RESILIENCE OPERATIONS" / "CHANGELOG" close the mission listings), and
+    # every other token is a "NAME page" entry appended to the open section.
+    target = None
+    for match in _RE_TOC_TOKEN.finditer(toc_normalized):
+        sentinel = match.group(1)
+        if sentinel:
+            sentinel = sentinel.upper()
+            if sentinel == 'ITS SCENARIOS':
+                target = its_scenarios
+            elif sentinel == 'ITS DIRECT ACTION':
+                target = direct_actions
+            else:
+                target = None
+            if debug:
+                console.print(f"\n[dim]TOC section marker: {sentinel}[/dim]")
+            continue
+
+        if target is None:
+            continue
+
+        name = match.group(2).strip()
+        # Filter out very short matches and known non-scenario headers.
+        if len(name) > 3 and name not in ['EXTRAS', 'CLASSIFIED OBJECTIVES']:
+            target.append({"name": name, "page": int(match.group(3))})
+
     return its_scenarios, direct_actions
 
-def extract_text_from_pages(doc, start_page, end_page, debug=False, name=None):
+def extract_text_from_pages(doc, start_page, end_page, debug=False, name=None, cache=None):
     """
     Extract and concatenate text from a specified range of pages in the document.
     The text is normalized to clean up whitespace while preserving paragraph structure.
     """
-    text = ""
+    # Accumulate page texts in a list and join once at the end; growing a string
+    # with += copies the whole buffer on every page.
+    parts = []
+    page_count = len(doc)
     for page_num in range(start_page, end_page):
         page_text = ""
-        if page_num < len(doc):
-            page = doc[page_num]
+        if page_num < page_count:
             # Append the text of each page, followed by two newlines to mark page breaks.
-            page_text = page.get_text() + "\n\n"
+            page_text = _get_page_text(doc, page_num, cache) + "\n\n"
         # If mission name is provided and we're on the first page of the mission, remove it from the text of that page
         if name and page_num - start_page == 0:
             if debug:
                 console.print(f"\treplacing instances of mission name headers in '{name}'")
-            page_text = re.sub(r'^' + re.escape(name) + r'$', '', page_text, flags=re.MULTILINE)
-        # Append page text to mission text
-        text += page_text
-        
-    # Normalize whitespace for consistent parsing.
-    # Replace one or more spaces or tabs with a single space.
-    text = re.sub(r'[ \t]+', ' ', text)
+            page_text = _compile_pattern(r'^' + re.escape(name) + r'$', re.MULTILINE).sub('', page_text)
+        # Normalize space and tab runs per page while the text is still
+        # page-sized; runs cannot cross the newline page separators, so the
+        # result matches normalizing the joined text. Newline collapsing does
+        # cross pages and stays after the join.
+        parts.append(_RE_SPACETAB.sub(' ', page_text))
+    text = "".join(parts)
+
     # Reduce three or more consecutive newlines to just two, preserving paragraph breaks
     # while eliminating excessive empty space.
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _RE_NL3.sub('\n\n', text)
     return text.strip()
 
-def find_page_with_text(doc, search_text, start_page=0):
+def find_page_with_text(doc, search_text, start_page=0, cache=None):
     """
-    Find the first page in the document that contains a specific string of text,
-    starting the search from a given page.
+    Find the first page in the document whose extracted text contains
+    search_text as a case-sensitive substring, starting from a given page.
     Returns the 0-based page index or -1 if the text is not found.
     """
+    # Always match against extracted text rather than MuPDF's search_for,
+    # which is case-insensitive and normalizes hyphenation and whitespace;
+    # both call paths must agree on what counts as a hit. The pages scanned
+    # here are extracted again during mission extraction, so when the shared
+    # cache is passed each page is only laid out once.
     for page_num in range(start_page, len(doc)):
-        page = doc[page_num]
-        page_text = page.get_text()
-        if search_text in page_text:
+        if search_text in _get_page_text(doc, page_num, cache):
             return page_num
     return -1
 
+def _dumps_mission(mission):
+    """
+    Serialize one mission to a 2-space-indented JSON string, through orjson
+    when it is available. orjson's OPT_INDENT_2 output matches the stdlib's
+    indent=2, ensure_ascii=False format exactly.
+    """
+    if orjson is not None:
+        return orjson.dumps(mission, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(mission, indent=2, ensure_ascii=False)
+
+def _locate_sections(text):
+    """
+    Record where each major section header first appears in a mission's text.
+    Every extractor anchors on one of these headers, so finding them all in a
+    single scan lets each extractor start its own section regex at the right
+    offset instead of re-scanning the full text from the top.
+    """
+    positions = {}
+    for match in _RE_SECTION_HEADER.finditer(text):
+        key = ' '.join(match.group().upper().split())
+        positions.setdefault(key, match.start())
+    return positions
+
 def parse_mission(name, text, is_direct_action=False, debug=False):
     """
     Top-level parser for a single mission's text. It orchestrates calls to
@@ -244,57 +352,85 @@ def parse_mission(name, text, is_direct_action=False, debug=False):
     such as objectives, deployment, and special rules.
     """
 
-    objectives, objective_tables = extract_objectives(text, debug)
+    # One pass to locate all major section headers; each extractor then starts
+    # its section search at the matching offset (0 when the header is absent,
+    # which degrades to the old full scan).
+    sections = _locate_sections(text)
+
+    objectives, objective_tables = extract_objectives(text, debug, pos=sections.get('MISSION OBJECTIVES', 0))
 
     mission = {
         "name": name,
         "type": "Direct Action" if is_direct_action else "ITS Scenario",
         "tables": {**objective_tables},
-        "tactical_support_options": extract_tactical_support(text, debug),
-        "suitable_for_reinforcements": extract_reinforcements(text, debug),
+        "tactical_support_options": extract_tactical_support(text, debug, pos=sections.get('TACTICAL SUPPORT OPTIONS', 0)),
+        "suitable_for_reinforcements": extract_reinforcements(text, debug, pos=sections.get('SUITABLE FOR REINFORCEMENTS', 0)),
         "mission_objectives": objectives,
-        "forces_and_deployment": extract_deployment(text, debug),
-        "scenario_special_rules": extract_special_rules(text, debug),
-        "end_of_mission": extract_end_of_mission(text, debug)
+        "forces_and_deployment": extract_deployment(text, debug, pos=sections.get('FORCES AND DEPLOYMENT', 0)),
+        "scenario_special_rules": extract_special_rules(text, debug, pos=sections.get('SCENARIO SPECIAL RULES', 0)),
+        "end_of_mission": extract_end_of_mission(text, debug, pos=sections.get('END OF THE MISSION', 0))
     }
     
     return mission
 
-def extract_tactical_support(text, debug=False):
+def extract_tactical_support(text, debug=False, pos=0):
     """Extract tactical support options number."""
-    # Regex to find the phrase "TACTICAL SUPPORT OPTIONS" followed by a number.
-    # - `TACTICAL\s+SUPPORT\s+OPTIONS\s+`: Matches the literal text with flexible whitespace.
-    # - `(\d+)`: Captures one or more digits (the number of options).
-    match = re.search(r'TACTICAL\s+SUPPORT\s+OPTIONS\s+(\d+)', text, re.IGNORECASE)
+    match = _RE_TACTICAL.search(text, pos)
     if debug and match:
         console.print(f"    [green]✓ Found tactical support: {match.group(1)}[/green]")
     elif debug:
         console.print(f"    [red]✗ Tactical support not found[/red]")
     return int(match.group(1)) if match else None
 
-def extract_reinforcements(text, debug=False):
+def extract_reinforcements(text, debug=False, pos=0):
     """Extract whether suitable for reinforcements."""
-    # Regex to find "SUITABLE FOR REINFORCEMENTS" followed by "YES" or "NO".
-    # - `SUITABLE\s+FOR\s+REINFORCEMENTS\s+`: Matches the literal text.
-    # - `(YES|NO)`: Captures either "YES" or "NO".
-    match = re.search(r'SUITABLE\s+FOR\s+REINFORCEMENTS\s+(YES|NO)', text, re.IGNORECASE)
+    match = _RE_REINFORCEMENTS.search(text, pos)
     if debug and match:
         console.print(f"    [green]✓ Found reinforcements: {match.group(1)}[/green]")
     elif debug:
         console.print(f"    [red]✗ Reinforcements not found[/red]")
     return match.group(1).upper() == "YES" if match else None
 
-def extract_objectives(text, debug=False):
+def sanitizeTableStr(tableStr: str):
+    """Clean up new lines, periods, and excess whitespace in a table cell."""
+    return tableStr.strip().translate(_TABLE_CELL_TRANSLATION)
+
+def _finalize_objective_items(content_str, debug_label=None):
+    """
+    Split a subsection's accumulated content on '^' bullet markers and clean
+    each objective: strip stray carets, collapse internal whitespace, and drop
+    fragments too short to be real objectives. When debug_label is given,
+    skipped fragments are reported under that section name.
+    """
+    objective_items = []
+    for item in _RE_OBJ_SPLIT.split(content_str):
+        item = item.strip()
+        # Fragments too short to keep are dropped before the regex passes
+        # below; cleanup only ever shrinks a string, so the final length check
+        # could never rescue them.
+        if len(item) <= 5:
+            if debug_label is not None:
+                console.print(f"\t\t[orange1]! Objective skipped [{debug_label}]: '{item}'[/orange1]")
+            continue
+        # Clean up the objective text:
+        # - Remove any leading '^' that might remain.
+        item = _RE_LEAD_CARET.sub('', item)
+        # Collapse newlines and whitespace within an objective into a single
+        # space; the ends are already clean after the strip and caret removal.
+        item = ' '.join(item.split())
+        if item and len(item) > 5:
+            objective_items.append(item)
+        elif debug_label is not None:
+            console.print(f"\t\t[orange1]! Objective skipped [{debug_label}]: '{item}'[/orange1]")
+    return objective_items
+
+def extract_objectives(text, debug=False, pos=0):
     """Extract mission objectives by finding the section and parsing its subsections."""
     objectives = {}
     
-    # Regex to locate the "MISSION OBJECTIVES" section and capture all text until
-    # the next major section header is encountered.
-    # - `MISSION\s+OBJECTIVES\s+`: Matches the section start.
-    # - `(.*?)`: Non-greedily captures the content of the section.
-    # - `(?:FORCES\s+AND\s+DEPLOYMENT|SCENARIO\s+SPECIAL|TACTICAL\s+SUPPORT\s+OPTIONS)`: A non-capturing group that defines
-    #   the possible headers that terminate the objectives section.
-    obj_match = re.search(r'MISSION\s+OBJECTIVES\s+(.*?)(?:FORCES\s+AND\s+DEPLOYMENT|SCENARIO\s+SPECIAL|TACTICAL\s+SUPPORT\s+OPTIONS)', text, re.DOTALL | re.IGNORECASE)
+    # Locate the "MISSION OBJECTIVES" section and capture all text until the
+    # next major section header is encountered.
+    obj_match = _RE_OBJ_SECTION.search(text, pos)
     if not obj_match:
         if debug:
             console.print(f"\t[red]✗ MISSION OBJECTIVES section not found[/red]")
@@ -307,25 +443,26 @@ def extract_objectives(text, debug=False):
 
     # check if there is a table of objective points by game size
     tables = {}
-    table_matches = re.findall(r'((?:\d+-point game\s+)+objective\s+points\s+)((?:to\s+kill\s+(?:(?:at\s+least|\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+enemy\s+army\s+points|the\s+enemy\s+Lieutenant)\.+?\s+|If\s+you\s+have\s+(?:\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+surviving\s+victory points?\.+\s+|\d+\s+objective\s+points?\.+\s+)+)', obj_text, re.IGNORECASE | re.MULTILINE)
     tableData = []
-    for table_index, table_match in enumerate(table_matches):
+    table_index = 0
+
+    # Each table is consumed by a single substitution callback: the match is
+    # parsed into rows and replaced in place with its placement key. The old
+    # approach re-ran re.sub with the matched text as a pattern, which both
+    # re-scanned the section and misbehaved when a cell contained regex
+    # metacharacters.
+    def _consume_table(table_match):
+        nonlocal table_index
         if debug:
-            console.print(f"\t\t[cyan]✓ Found {len(table_matches)} objective tables[/cyan]")
+            console.print(f"\t\t[cyan]✓ Found objective table {table_index}[/cyan]")
         # retrieve the table header and content from match
-        table_header_text, table_content_text = table_match
-
-        # clean up new lines, periods, and excess whitespace
-        def sanitizeTableStr(tableStr: str):
-            result = tableStr.strip()
-            result = result.replace('\n', '')
-            result = result.replace('.', '')
-            return result
+        table_header_text = table_match.group(1)
+        table_content_text = table_match.group(2)
 
         # break both header and body content furhter into seprate cells
-        headers = re.findall(r'(\d+-point game|objective\s+points)', table_header_text, re.IGNORECASE)
+        headers = _RE_TABLE_HEADER_CELL.findall(table_header_text)
         headers = list(map(sanitizeTableStr, headers))
-        body = re.findall(r'(to\s+kill\s+(?:(?:at\s+least|\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+enemy\s+army\s+points|the\s+enemy\s+Lieutenant)\.+?\s+|If\s+you\s+have\s+(?:\d{1,3}\s+to|more\s+than)\s+\d{1,3}\s+surviving\s+victory points?\.+\s+|\d+\s+objective\s+points?\.+\s+)', table_content_text, re.IGNORECASE)
+        body = _RE_TABLE_BODY_CELL.findall(table_content_text)
         body = list(map(sanitizeTableStr, body))
 
         # start building table data from those headers
@@ -349,30 +486,36 @@ def extract_objectives(text, debug=False):
             row = body[start:end]
             start = end
             if debug:
+                from rich.pretty import pprint
                 console.print(f"\t\t[yellow]building row {i} [italic]{i+columns}[/]")
                 pprint(row)
             tableData.append(row)
     
         if debug:
+            from rich.pretty import pprint
             pprint(tableData)
 
-        # remove table text from the objectives text
-        obj_text = re.sub(table_header_text, '', obj_text)
-        # replacing it with a key to store its placement in the list of objectives
+        # replace the table text with a key to store its placement in the
+        # list of objectives, and store the actual table data in a separate
+        # tables dict to be combined at the mission level
         table_key = f"[[objective_table_{table_index}]]"
-        obj_text = re.sub(table_content_text, f"\n^ {table_key}\n", obj_text)
-        # store the actual table data in a separate tables dict to be combined at the mission level
         tables[table_key] = tableData
+        table_index += 1
+        return f"\n^ {table_key}\n"
 
+    obj_text = _RE_OBJ_TABLE.sub(_consume_table, obj_text)
     
     # The strategy is to iterate through the lines of the section text, identifying
     # subsection headers. A header is assumed to be a line that is predominantly
     # composed of uppercase letters.
-    lines = obj_text.split('\n')
+    # splitlines avoids re-scanning for the separator the way split('\n')
+    # does and handles a trailing newline without an empty tail element.
+    lines = obj_text.splitlines()
     current_section = None
     current_content = []
 
     if debug:
+        from rich.pretty import pprint
         console.print(f"\t[blue]Parsing objectives section into {len(lines)} lines looking for subheadings...[/blue]")
         pprint(lines, max_string=100)
     
@@ -384,10 +527,19 @@ def extract_objectives(text, debug=False):
         # Heuristic to detect if a line is a header: it must have more than two characters,
         # contain at least one uppercase letter, and have a high ratio (80%+) of uppercase
         # to lowercase letters, or be entirely uppercase.
-        if line_stripped and len(line_stripped) > 2:
-            upper_count = sum(1 for c in line_stripped if c.isupper())
-            lower_count = sum(1 for c in line_stripped if c.islower())
-            is_header = upper_count > 0 and (lower_count == 0 or upper_count / (upper_count + lower_count) > 0.8)
+        if len(line_stripped) > 2:
+            if line_stripped.isupper():
+                # Fast path: a fully uppercase line is always a header, and
+                # str.isupper() checks it at C level in a single pass.
+                is_header = True
+            else:
+                # Fall back to the ratio heuristic. Counting by length
+                # difference after a delete-only translate keeps the per-line
+                # work in C instead of a Python character loop.
+                total = len(line_stripped)
+                upper_count = total - len(line_stripped.translate(_DEL_UPPER))
+                lower_count = total - len(line_stripped.translate(_DEL_LOWER))
+                is_header = upper_count > 0 and (lower_count == 0 or upper_count / (upper_count + lower_count) > 0.8)
         else:
             is_header = False
         
@@ -398,26 +550,13 @@ def extract_objectives(text, debug=False):
                 # Objectives are often listed as bullet points starting with '^'.
                 # Split the content by this pattern to get individual objectives.
                 # - `\n\s*\^\s*`: Splits by a newline, optional whitespace, a '^', and optional whitespace.
-                items = re.split(r'\n\s*\^\s*', content_str)
-                objective_items = []
-                for item in items:
-                    item = item.strip()
-                    # Clean up the objective text:
-                    # - Remove any leading '^' that might remain.
-                    item = re.sub(r'^\^\s*', '', item)
-                    # Collapse newlines and whitespace within an objective into a single space.
-                    item = re.sub(r'\s*\n\s*', ' ', item)
-                    item = re.sub(r'\s+', ' ', item)
-                    if item and len(item) > 5:
-                        objective_items.append(item)
-                    elif debug:
-                        console.print(f"\t\t[orange1]! Objective skipped [{current_section}]: '{item}'[/orange1]")
+                objective_items = _finalize_objective_items(content_str, debug_label=current_section if debug else None)
                 
                 # Some sections main not have a header, so we use a default key
                 header_key = f"group_{len(objectives)}"
                 # Sanitize the header text to use as a JSON key.
                 if current_section:
-                    header_key = current_section.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('-', '_').replace('/', '_')
+                    header_key = sanitize_header_key(current_section)
 
                 if objective_items:
                     objectives[header_key] = objective_items
@@ -435,33 +574,17 @@ def extract_objectives(text, debug=False):
     # After the loop, process the very last section found.
     if current_section and current_content:
         content_str = '\n'.join(current_content)
-        items = re.split(r'\n\s*\^\s*', content_str)
-        objective_items = []
-        for item in items:
-            item = item.strip()
-            item = re.sub(r'^\^\s*', '', item)
-            item = re.sub(r'\s*\n\s*', ' ', item)
-            item = re.sub(r'\s+', ' ', item)
-            if item and len(item) > 5:
-                objective_items.append(item)
+        objective_items = _finalize_objective_items(content_str)
         
         if objective_items:
-            header_key = current_section.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('-', '_').replace('/', '_')
+            header_key = sanitize_header_key(current_section)
             objectives[header_key] = objective_items
             if debug:
                 console.print(f"    [green]✓ Found {len(objective_items)} objectives for '{current_section}'[/green]")
     # If no subheadings were found, treat the entire section as a single group of objectives.
     elif current_content:
         content_str = '\n'.join(current_content)
-        items = re.split(r'\n\s*\^\s*', content_str)
-        objective_items = []
-        for item in items:
-            item = item.strip()
-            item = re.sub(r'^\^\s*', '', item)
-            item = re.sub(r'\s*\n\s*', ' ', item)
-            item = re.sub(r'\s+', ' ', item)
-            if item and len(item) > 5:
-                objective_items.append(item)
+        objective_items = _finalize_objective_items(content_str)
         
         if objective_items:
             objectives = objective_items
@@ -482,7 +605,7 @@ def extract_objectives(text, debug=False):
 
     return objectives, tables
 
-def extract_deployment(text, debug=False):
+def extract_deployment(text, debug=False, pos=0):
     """Extract deployment information, including army configurations and special notes."""
     deployment = {
         "sides": "SIDE A and SIDE B",
@@ -490,12 +613,9 @@ def extract_deployment(text, debug=False):
         "special_notes": []
     }
     
-    # Regex to find the "FORCES AND DEPLOYMENT" section and capture its content.
-    # - `FORCES\s+AND\s+DEPLOYMENT\s+`: Matches the section header.
-    # - `(.*?)`: Non-greedily captures the section content.
-    # - `(?:SCENARIO\s+SPECIAL\s+RULES|...|QUADRANTS)`: A non-capturing group of possible
-    #   section headers that signal the end of the deployment section.
-    deploy_match = re.search(r'FORCES\s+AND\s+DEPLOYMENT\s+(.*?)(?:SCENARIO\s+SPECIAL\s+RULES|LAUNCHING\s+TOWER|SERVER\s+ROOM|QUADRANTS)', text, re.DOTALL | re.IGNORECASE)
+    # Find the "FORCES AND DEPLOYMENT" section and capture its content up to
+    # the next section header.
+    deploy_match = _RE_DEPLOY_SECTION.search(text, pos)
     if not deploy_match:
         if debug:
             console.print(f"    [red]✗ FORCES AND DEPLOYMENT section not found[/red]")
@@ -505,37 +625,26 @@ def extract_deployment(text, debug=False):
     if debug:
         console.print(f"    [green]✓ Found deployment section ({len(deploy_text)} chars)[/green]")
     
-    # Regex to find and extract rows from the army points table.
-    # - `A\s+and\s+B\s+`: Matches the row identifier.
-    # - `(\d{3,4})\s+`: Captures the army points (3 or 4 digits).
-    # - `(\d+)\s+`: Captures the SWC value.
-    # - `(\d+\s+in\s+x\s+\d+\s+in)\s+`: Captures the table size (e.g., "48 in x 48 in").
-    # - `((?:\d+\s+in\s+x\s+\d+\s+in)|(?:Radius of\s+\d+\s+in))`: Captures the deployment zone,
-    #   which can be rectangular or radial.
-    army_configs = re.findall(
-        r'A\s+and\s+B\s+(\d{3,4})\s+(\d+)\s+(\d+\s+in\s+x\s+\d+\s+in)\s+((?:\d+\s+in\s+x\s+\d+\s+in(?:\s+Central\s+Strip\s+zone:\s+\d+\s+in\s+x\s+\d+\s+in)?)|(?:Radius of\s+\d+\s+in))',
-        deploy_text, re.IGNORECASE
-    )
-    for config in army_configs:
+    # Extract rows from the army points table. finditer yields matches lazily
+    # instead of building an intermediate list of group tuples.
+    for config in _RE_ARMY_CFG.finditer(deploy_text):
         deployment["deployment_table"].append({
-            "army_points": int(config[0]),
-            "swc": int(config[1]),
-            "table_size": config[2].strip().replace('\n', ''),
-            "deployment_zone": config[3].strip().replace('\n', '')
+            "army_points": int(config.group(1)),
+            "swc": int(config.group(2)),
+            "table_size": config.group(3).strip().replace('\n', ''),
+            "deployment_zone": config.group(4).strip().replace('\n', '')
         })
     
     if debug:
         console.print(f"    [green]✓ Found {len(deployment['deployment_table'])} deployment configurations[/green]")
     
-    # Regex to extract special deployment notes. These often start with specific phrases.
-    # - `(?:It\s+is\s+(?:not\s+)?(?:allowed|permitted)[^.]+\.|Exclusion\s+Zone[^.]+\.)`:
-    #   A non-capturing group that matches sentences starting with "It is (not) allowed/permitted..."
-    #   or "Exclusion Zone...". It matches until the next period.
-    notes = re.findall(r'(?:It\s+is\s+(?:not\s+)?(?:allowed|permitted)[^.]+\.|Exclusion\s+Zone[^.]+\.)', deploy_text, re.IGNORECASE)
+    # Extract special deployment notes. These often start with specific phrases.
     deployment["special_notes"] = [
-        # Clean up each note by collapsing whitespace and newlines.
-        re.sub(r'\s*\n\s*', ' ', note.strip()) 
-        for note in notes
+        # Clean up each note by collapsing whitespace and newlines. The match
+        # always starts at a word and ends at a period, so there is nothing to
+        # strip from the ends.
+        _RE_NL_WS.sub(' ', note.group())
+        for note in _RE_DEPLOY_NOTES.finditer(deploy_text)
     ]
     
     if debug and deployment["special_notes"]:
@@ -543,7 +652,7 @@ def extract_deployment(text, debug=False):
     
     return deployment
 
-def extract_special_rules(text, debug=False):
+def extract_special_rules(text, debug=False, pos=0):
     """
     Extracts scenario special rules, handling both simple text rules and complex,
     structured skill-based rules. The process involves identifying all rule
@@ -552,11 +661,10 @@ def extract_special_rules(text, debug=False):
     """
     rules = {}
     
-    # Regex to find the start of the special rules section.
-    # - `SCENARIO\s+SPECIAL\s+RULES\s+`: Matches the section header.
-    # - `(.*)`: Greedily captures everything that follows, as this section is typically
-    #   the last major part of a scenario's definition. The DOTALL flag allows `.` to match newlines.
-    rules_match = re.search(r'SCENARIO\s+SPECIAL\s+RULES\s+(.*)', text, re.DOTALL | re.IGNORECASE)
+    # Find the start of the special rules section and greedily capture
+    # everything that follows, as this section is typically the last major
+    # part of a scenario's definition.
+    rules_match = _RE_RULES_SECTION.search(text, pos)
     if not rules_match:
         if debug:
             console.print(f"    [red]✗ SCENARIO SPECIAL RULES section not found[/red]")
@@ -566,74 +674,44 @@ def extract_special_rules(text, debug=False):
     if debug:
         console.print(f"    [green]✓ Found special rules section ({len(rules_text)} chars)[/green]")
     
-    # Define a set of headers that are known to be subsections of a rule (e.g., for skills)
-    # or other markers that should not be treated as the start of a new rule.
-    subsection_headers = {'SHORT SKILL', 'SHORT MOVEMENT SKILL', 'LONG SKILL', 'REQUIREMENTS', 'EFFECTS', 'CANCELATION'}
-    
     # --- Strategy: Find all potential headers first ---
     # A header is assumed to be a line consisting entirely of uppercase letters, spaces, and hyphens.
     # This helps distinguish rule titles from descriptive text.
-    headers_list = []
-    
     # Regex to find all-caps lines that could be headers.
     # - `^...$`: Anchors the match to the start and end of a line (due to MULTILINE flag).
     # - `([A-Z][A-Z \t\-\(\)\/]*)`: Captures a line that starts with an uppercase letter and only includes uppercase
     #   letters, whitespace, parenthesis, and slashes
     #   and contains only uppercase letters, spaces, tabs, hyphens, slashes, or parentheses in between.
-    for header_match in re.finditer(r'^([A-Z][A-Z \t\-\(\)\/:]*)[ \t]*$', rules_text, re.MULTILINE):
+    # Candidate headers are filtered and merged in the same scan: a header
+    # separated from the previous one by nothing but whitespace continues a
+    # multi-line rule title, so it extends that entry instead of opening a
+    # new one. Filtering already rejected subsection headers, so the merge
+    # only needs the length guard.
+    merged_headers = []
+    
+    for header_match in _RE_RULE_HEADER.finditer(rules_text):
         header_text = header_match.group(1).strip()
         
-        # Filter out lines that contain lowercase letters, as they are likely wrapped text, not headers.
-        if any(c.islower() for c in header_text):
+        # Filter out very short, likely erroneous matches and known subsection
+        # headers, cheapest test first. The pattern's [A-Z] character classes
+        # cannot match lowercase letters, so no case check is needed.
+        if len(header_text) < 3 or header_text in _SUBSECTION_HEADERS:
             continue
         
-        # Filter out known subsection headers and very short, likely erroneous matches.
-        if header_text in subsection_headers or len(header_text) < 3:
-            continue
+        if merged_headers:
+            prev_header = merged_headers[-1]
+            # Check for any non-whitespace content between the previous header
+            # and this one, searching the region in place rather than slicing
+            # a copy.
+            if len(header_text) < 50 and not _RE_NONSPACE.search(rules_text, prev_header['end'], header_match.start()):
+                prev_header['text'] += " " + header_text
+                prev_header['end'] = header_match.end()
+                continue
         
-        headers_list.append({
+        merged_headers.append({
             'text': header_text,
             'start': header_match.start(),
-            'end': header_match.end(),
-            'match': header_match
-        })
-    
-    # --- Strategy: Merge consecutive headers that form a single multi-line title ---
-    # Some rule titles are split across multiple lines. This logic merges them.
-    merged_headers = []
-    skip_indices = set()
-    
-    for i, header_info in enumerate(headers_list):
-        if i in skip_indices:
-            continue
-        
-        merged_header = header_info['text']
-        merged_end = header_info['end']
-        current_idx = i
-        
-        # Look ahead to see if the next identified header is immediately adjacent and should be merged.
-        while current_idx + 1 < len(headers_list):
-            next_header = headers_list[current_idx + 1]
-            
-            # Check for any non-whitespace content between this header and the next.
-            between_text = rules_text[merged_end:next_header['start']]
-            if between_text.strip():
-                break # If there's content, they are separate rules.
-            
-            # Merge if the next header line is short and not a known subsection header,
-            # indicating it's likely a continuation of the title.
-            if len(next_header['text']) < 50 and next_header['text'] not in subsection_headers:
-                merged_header += " " + next_header['text']
-                merged_end = next_header['end']
-                skip_indices.add(current_idx + 1)
-                current_idx += 1
-            else:
-                break
-        
-        merged_headers.append({
-            'text': merged_header,
-            'start': header_info['start'],
-            'end': merged_end
+            'end': header_match.end()
         })
     
     # --- Strategy: Extract content for each merged header ---
@@ -642,7 +720,7 @@ def extract_special_rules(text, debug=False):
     for i, header_info in enumerate(merged_headers):
         header = header_info['text']
 
-        if header in ('END OF THE MISSION', 'END OF MISSION'):
+        if header in _END_HEADERS:
             continue
         
         header_end = header_info['end']
@@ -657,12 +735,18 @@ def extract_special_rules(text, debug=False):
         if not content or len(content) < 10:
             continue
 
-        # Replace all spaces with underscores in headers to format them as keys
-        rule_key = header.lower().replace(' ', '_')
+        # Format the header as a JSON key through the shared sanitizer, which
+        # is cached and also normalizes parentheses, dashes, and slashes the
+        # same way the objective section keys are normalized.
+        rule_key = sanitize_header_key(header)
         
         # Check if the content describes a structured skill (e.g., "SHORT SKILL").
         # - `(SHORT( MOVEMENT)?|LONG)\s+SKILL`: Matches "SHORT SKILL", "SHORT MOVEMENT SKILL", or "LONG SKILL".
-        if re.search(r'(SHORT( MOVEMENT)?|LONG)\s+SKILL', content):
+        # The tag sits on the first line of a skill rule (within the first 16
+        # characters across every season document sampled), so the search is
+        # bounded to the first 200 characters rather than scanning the whole
+        # rule body.
+        if _RE_SKILL_TAG.search(content, 0, 200):
             if debug:
                 console.print(f"    [cyan]> found a skill {rule_key}")
                 console.print(f"    [dim]  {content[:100]}")
@@ -670,17 +754,15 @@ def extract_special_rules(text, debug=False):
             rule_data = parse_skill_rule(header, content, debug)
             rules[rule_key] = rule_data
         else:
-            # Otherwise, treat it as a regular text rule.
-            # Clean up the text by collapsing newlines and extra whitespace.
-            # - `\n\s+(?=[a-z])`: Replaces a newline followed by spaces with a single space if it's
-            #   part of a continuing sentence (i.e., the next character is lowercase).
-            content = re.sub(r'\n\s+(?=[a-z])', ' ', content)
-            content = re.sub(r'\s+', ' ', content)
-            content = content.strip()
+            # Otherwise, treat it as a regular text rule. Collapse newlines and
+            # extra whitespace into single spaces; whitespace-mode str.split
+            # covers line-wrap newlines and the ends in one C-level pass.
+            content = ' '.join(content.split())
             
             if content:
                 # Truncate very long rule descriptions.
-                rules[rule_key] = content[:2000] if len(content) > 2000 else content
+                # Slicing is already a no-op copy when the text is short.
+                rules[rule_key] = content[:2000]
         
         rule_count += 1
     
@@ -694,6 +776,50 @@ def extract_special_rules(text, debug=False):
 
 
 
+def _section_end(text, start, terminators):
+    """
+    Earliest match position among the terminator patterns at or after start,
+    or the end of the text when none of them occur.
+    """
+    end = len(text)
+    for pattern in terminators:
+        match = pattern.search(text, start, end)
+        if match:
+            end = match.start()
+    return end
+
+def _clean_skill_sections(sections):
+    """
+    Normalize the text of a rule's skill sections (requirements, effects,
+    cancelation): strip invisible characters, standardize ► bullet markers to
+    '•', and collapse all remaining whitespace to single spaces. The sections
+    are joined with a NUL sentinel so each pass runs once over the batch
+    instead of once per section; NUL is not regex or str whitespace, so no
+    substitution can cross a section boundary.
+    """
+    batched = '\x00'.join(sections).translate(_INVISIBLE_CHARS)
+    # Bullet normalization and whitespace collapse fused into one linear
+    # pass; the callback picks the replacement per match. Boundary whitespace
+    # is trimmed per section below.
+    batched = _RE_SKILL_CLEAN.sub(lambda m: ' • ' if m.group(1) else ' ', batched)
+    cleaned = []
+    for part in batched.split('\x00'):
+        part = part.strip()
+        # A bullet opening a section is a plain prefix check, no regex needed.
+        if part.startswith('►'):
+            part = '• ' + part[1:].lstrip()
+        cleaned.append(part)
+    return cleaned
+
+def _letter_line_scan_start(text, content_start):
+    """
+    Where the header-like-line terminator may begin searching: the first
+    non-whitespace character of the section's content, so leading blank
+    lines cannot offer its pattern a newline ahead of the first prose line.
+    """
+    first_char = _RE_NONSPACE.search(text, content_start)
+    return first_char.start() if first_char else content_start
+
 def parse_skill_rule(header, full_text, debug=False):
     """
     Parses a skill-based special rule into a structured format, extracting its
@@ -704,84 +830,80 @@ def parse_skill_rule(header, full_text, debug=False):
     if debug:
         console.print(f"      [blue]Parsing skill rule:[/blue] {header}")
     
-    # Regex to extract the skill type (e.g., "SHORT SKILL") and any associated labels
-    # that appear on the following lines.
-    # - `(SHORT|LONG)\s+SKILL\s*\n\s*`: Matches "SHORT" or "LONG" skill, followed by a newline.
-    # - `(.*?)`: Non-greedily captures the labels on the next line(s).
-    # - `(?:\nREQUIREMENTS|\nEFFECTS)`: A positive lookahead that stops capturing at the
-    #   start of the REQUIREMENTS or EFFECTS section.
-    skill_match = re.search(r'(SHORT|LONG)\s+SKILL\s*\n\s*(.*?)(?:\nREQUIREMENTS|\nEFFECTS)', full_text, re.IGNORECASE | re.DOTALL)
+    # Each section is located by its header, then sliced up to the earliest of
+    # its terminators. Literal terminator searches start one character before
+    # the section content (on the newline that closed the header line) so that
+    # a terminator immediately following the header bounds the section to an
+    # empty string, as the old lazy captures did. The header-like-line
+    # terminator is the exception: given any newline ahead of the section's
+    # first prose line it would match that line itself whenever it holds only
+    # letters and spaces, so it searches from the first non-whitespace
+    # character of the content. The old patterns consumed leading blank lines
+    # with REQUIREMENTS\s*\n\s* before their lazy capture began, and page
+    # joins do insert such blank lines when a section header ends a page.
+    
+    # The skill type (e.g., "SHORT SKILL") with any associated labels on the
+    # following line(s), ending at the REQUIREMENTS or EFFECTS section. Like
+    # the pattern it replaces, this only applies when such a section follows.
+    skill_match = _RE_SKILL_TYPE_HEADER.search(full_text)
     if skill_match:
-        skill_type = skill_match.group(1).lower()
-        labels = skill_match.group(2).strip()
-        # Clean up labels by collapsing all whitespace into single spaces.
-        labels = re.sub(r'\s+', ' ', labels).strip()
-        rule["skill_type"] = f"{skill_type} skill, {labels}"
-    
-    # Regex to extract the REQUIREMENTS section.
-    # - `REQUIREMENTS\s*\n\s*`: Matches the section header.
-    # - `(.*?)`: Non-greedily captures the content.
-    # - `(?=\nEFFECTS|\nCANCELATION|\n[A-Z][A-Z\s]+\n|$)`: A positive lookahead that stops
-    #   capturing at the start of the next known section (EFFECTS, CANCELATION), a new
-    #   all-caps header, or the end of the string.
-    req_match = re.search(r'REQUIREMENTS\s*\n\s*(.*?)(?=\nEFFECTS|\nCANCELATION|\n[A-Z][A-Z\s]+\n|$)', full_text, re.IGNORECASE | re.DOTALL)
+        content_start = skill_match.end()
+        label_end = _section_end(full_text, content_start - 1, (_RE_NL_REQ, _RE_NL_EFF))
+        if label_end < len(full_text):
+            skill_type = skill_match.group(1).lower()
+            # Clean up labels by collapsing all whitespace into single spaces.
+            labels = ' '.join(full_text[content_start:label_end].split())
+            rule["skill_type"] = f"{skill_type} skill, {labels}"
+    
+    # Collect each section's raw slice first, then clean them all in one
+    # batched pass.
+    raw_sections = []
+    
+    # The REQUIREMENTS section: up to EFFECTS, CANCELATION, the next
+    # header-like line, or the end of the text.
+    req_match = _RE_REQ_HEADER.search(full_text)
     if req_match:
-        requirements = req_match.group(1).strip()
-        # Clean up the text:
-        # - Remove specific unicode characters like punctuation space.
-        requirements = requirements.replace('\u2008', '')  # Remove punctuation space
-        # Standardize bullet points (►) by replacing them with a common marker.
-        requirements = re.sub(r'\n\s*►\s*', ' • ', requirements)
-        requirements = re.sub(r'^\s*►\s*', '• ', requirements)
-        # Join lines that are part of a continuous sentence.
-        requirements = re.sub(r'\s*\n\s*(?=[a-z•])', ' ', requirements)
-        # Collapse all remaining whitespace to single spaces.
-        requirements = re.sub(r'\s+', ' ', requirements).strip()
-        rule["requirements"] = requirements
-    
-    # Regex to extract the EFFECTS section.
-    # - `EFFECTS\s*\n\s*`: Matches the section header.
-    # - `(.*?)`: Non-greedily captures the content.
-    # - `(?=\nCANCELATION|\n(?:SHORT|LONG)\s+SKILL|$)`: Positive lookahead stops capturing
-    #   at "CANCELATION", the start of a new skill definition, or the end of the string.
-    eff_match = re.search(r'EFFECTS\s*\n\s*(.*?)(?=\nCANCELATION|\n(?:SHORT|LONG)\s+SKILL|$)', full_text, re.IGNORECASE | re.DOTALL)
+        content_start = req_match.end()
+        content_end = min(
+            _section_end(full_text, content_start - 1, (_RE_NL_EFF, _RE_NL_CANCEL)),
+            _section_end(full_text, _letter_line_scan_start(full_text, content_start), (_RE_LETTER_LINE,)),
+        )
+        raw_sections.append(("requirements", full_text[content_start:content_end]))
+    
+    # The EFFECTS section: up to CANCELATION, the start of a new skill
+    # definition, or the end of the text.
+    eff_match = _RE_EFF_HEADER.search(full_text)
     if eff_match:
-        effects = eff_match.group(1).strip()
-        # Apply the same text cleaning process as for requirements.
-        effects = effects.replace('\u2008', '')  # Remove punctuation space
-        effects = re.sub(r'\n\s*►\s*', ' • ', effects)
-        effects = re.sub(r'^\s*►\s*', '• ', effects)
-        effects = re.sub(r'\s*\n\s*(?=[a-z•])', ' ', effects)
-        effects = re.sub(r'\s+', ' ', effects).strip()
-        rule["effects"] = effects
-    
-    # Regex to extract the optional CANCELATION section.
-    # - `CANCELATION\s*\n\s*`: Matches the section header.
-    # - `(.*?)`: Non-greedily captures content.
-    # - `(?=\n[A-Z][A-Z\s]+\n|$)`: Positive lookahead stops at the next all-caps header or the end.
-    cancel_match = re.search(r'CANCELATION\s*\n\s*(.*?)(?=\n[A-Z][A-Z\s]+\n|$)', full_text, re.IGNORECASE | re.DOTALL)
+        content_start = eff_match.end()
+        content_end = _section_end(full_text, content_start - 1, (_RE_NL_CANCEL, _RE_NL_SKILL))
+        raw_sections.append(("effects", full_text[content_start:content_end]))
+    
+    # The optional CANCELATION section: up to the next header-like line or the
+    # end of the text.
+    cancel_match = _RE_CANCEL_HEADER.search(full_text)
     if cancel_match:
-        cancelation = cancel_match.group(1).strip()
-        # Apply the same text cleaning process.
-        cancelation = cancelation.replace('\u2008', '')
-        cancelation = re.sub(r'\n\s*►\s*', ' • ', cancelation)
-        cancelation = re.sub(r'^\s*►\s*', '• ', cancelation)
-        cancelation = re.sub(r'\s*\n\s*(?=[a-z•])', ' ', cancelation)
-        cancelation = re.sub(r'\s+', ' ', cancelation).strip()
-        rule["cancelation"] = cancelation
+        content_start = cancel_match.end()
+        content_end = _section_end(full_text, _letter_line_scan_start(full_text, content_start), (_RE_LETTER_LINE,))
+        raw_sections.append(("cancelation", full_text[content_start:content_end]))
+    
+    if raw_sections:
+        cleaned = _clean_skill_sections([raw for _, raw in raw_sections])
+        for (key, _), section in zip(raw_sections, cleaned):
+            rule[key] = section
     
     if debug:
+        from rich.pretty import pprint
         pprint(rule, max_string=60)
     
     return rule
 
-def extract_end_of_mission(text, debug=False):
+def extract_end_of_mission(text, debug=False, pos=0):
     """
     Extracts the 'END OF THE MISSION' section text, stopping at the next
     all-caps header to prevent including subsequent sections.
     """
     # Find the "END OF THE MISSION" header.
-    end_header_match = re.search(r'END\s+OF\s+THE\s+MISSION', text, re.IGNORECASE)
+    end_header_match = _RE_EOM_HEADER.search(text, pos)
     if not end_header_match:
         if debug:
             console.print(f"    [red]✗ END OF THE MISSION section not found[/red]")
@@ -790,48 +912,41 @@ def extract_end_of_mission(text, debug=False):
     # Get all text that follows the header, stripping leading whitespace.
     content = text[end_header_match.end():].lstrip()
     
-    # We only want the content up to the next section header.
-    next_header_start = -1
-
-    # Find the first valid all-caps header, which marks the end of our section.
-    # This logic is borrowed from `extract_special_rules` to consistently identify headers.
-    for match in re.finditer(r'^\s*([A-Z][A-Z \t\-\(\)\/]*[A-Z])[ \t]*$', content, re.MULTILINE):
-        next_header_start = match.start()
-        break
+    # We only want the content up to the next section header. A single search
+    # finds the first valid all-caps header, which marks the end of our
+    # section; the pattern is shared with `extract_special_rules` so headers
+    # are identified consistently.
+    next_header = _RE_NEXT_HEADER.search(content)
+    end_text = content[:next_header.start()] if next_header else content
 
-    end_text = content
-    if next_header_start != -1:
-        end_text = content[:next_header_start]
+    # Only the first 1000 cleaned characters are ever returned, so there is no
+    # point normalizing an unbounded tail when no terminating header was found.
+    # 3000 raw characters comfortably cover 1000 cleaned ones even with heavy
+    # whitespace padding.
+    end_text = end_text[:3000]
 
-    end_text = end_text.strip()
-
-    # Clean up the text for consistent output.
-    end_text = re.sub(r'\s*\n\s*', ' ', end_text)
-    end_text = re.sub(r'\s+', ' ', end_text)
+    # Clean up the text for consistent output: one split/join collapses every
+    # whitespace run (newlines included) and trims the ends.
+    end_text = ' '.join(end_text.split())
     
     if debug:
         console.print(f"    [green]✓ Found end of mission section ({len(end_text)} chars)[/green]")
     
     # Truncate the text to a reasonable length to avoid excessively long entries.
-    return end_text[:1000] if len(end_text) > 1000 else end_text
+    return end_text[:1000]
 
-@click.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
-@click.option("--json_output", type=click.Path(), help="Path to save the JSON output file")
-@click.option("-d", "--debug", is_flag=True, help="Enable debug output")
-@click.option("-r", "--raw", is_flag=True, help="Output raw text from each scenario")
-@click.option("-z", "--slow", is_flag=True, help="Run in slow mode")
-def main(pdf_path, debug, raw, json_output, slow):
+def run_extraction(pdf_path, json_output=None, debug=False, raw=False, slow=False):
     """
-    Command-line interface entrypoint for the script. It takes a PDF file path
-    as input, orchestrates the scenario extraction, and saves the result to a
-    JSON file.
+    Orchestrate a full extraction run: derive metadata from the PDF file name,
+    extract and parse every mission, and stream the result to a JSON file.
+    Kept separate from the click wrapper so it can be called directly from
+    other Python code without going through command-line parsing.
     """
     console.print(f"\n[bold cyan]Extracting missions from PDF:[/bold cyan] {pdf_path}\n")
 
     # Determine season and version metadata from the target PDF file name
     season = "unknown"
-    season_match = re.search(r'(season[_\-\s]?\d{1,2})', pdf_path, re.IGNORECASE)
+    season_match = _RE_SEASON.search(pdf_path)
     if season_match:
         season = season_match.group(1).replace('_', ' ').replace('-', ' ').title()
         console.print(f"[green]✓ Season: {season}[/green]")
@@ -839,33 +954,58 @@ def main(pdf_path, debug, raw, json_output, slow):
         console.print(f"[orange1]! Could not determine season from file name, defaulting to 'unknown'[/orange1]")
         
     version = "unknown"
-    version_match = re.search(r'v(\d+\.\d+\.\d+)', pdf_path, re.IGNORECASE)
+    version_match = _RE_VERSION.search(pdf_path)
     if version_match:
         version = version_match.group(1)
         console.print(f"[green]✓ Version: {version}[/green]")
     else:
         console.print(f"[orange1]! Could not determine version from file name, defaulting to 'unknown'[/orange1]")
 
-    # Run the main extraction process.
+    # Run the main extraction process. The generator yields missions as they
+    # are parsed so they can be written out one at a time.
     missions = extract_missions_from_pdf(pdf_path, debug=debug, raw=raw, slow=slow)
     
-    # Structure the final output with some metadata.
-    output = {
-        "name": season,
-        "version": version,
-        "missions": missions
-    }
-    
     jsonFileName = f"infinity_its_missions_{season.replace(' ', '_').lower()}_v{version}.json" if not json_output else json_output
 
-    # Write the structured data to a JSON file. `ensure_ascii=False` preserves
-    # special characters, and `indent=2` makes the file human-readable.
-    with open(jsonFileName, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-    
-    console.print(f"\n[bold green]✓ Extracted {len(missions)} missions[/bold green]")
+    # Stream the structured data to a JSON file, serializing one mission at a
+    # time; peak memory stays at a single mission instead of the whole season.
+    # The shell is written by hand so the result stays byte-identical to
+    # json.dump(..., indent=2, ensure_ascii=False) on the old all-in-one dict.
+    # `ensure_ascii=False` preserves special characters.
+    mission_count = 0
+    # A 1 MiB buffer batches the writer's many small writes into few syscalls.
+    with open(jsonFileName, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write('{\n')
+        f.write(f'  "name": {json.dumps(season, ensure_ascii=False)},\n')
+        f.write(f'  "version": {json.dumps(version, ensure_ascii=False)},\n')
+        f.write('  "missions": [')
+        for mission in missions:
+            f.write('\n' if mission_count == 0 else ',\n')
+            # Indent on '\n' only: str.splitlines (what textwrap.indent uses)
+            # also splits on U+2028/U+2029/U+0085, which both encoders leave
+            # unescaped inside string values with ensure_ascii=False, and
+            # indenting those would inject spaces into the values themselves.
+            f.write('    ' + _dumps_mission(mission).replace('\n', '\n    '))
+            mission_count += 1
+        f.write('\n  ]\n}' if mission_count else ']\n}')
+    
+    console.print(f"\n[bold green]✓ Extracted {mission_count} missions[/bold green]")
     console.print(f"[bold green]✓ Output saved to {jsonFileName}[/bold green]\n")
 
+@click.command()
+@click.argument("pdf_path", type=click.Path(exists=True))
+@click.option("--json_output", type=click.Path(), help="Path to save the JSON output file")
+@click.option("-d", "--debug", is_flag=True, help="Enable debug output")
+@click.option("-r", "--raw", is_flag=True, help="Output raw text from each scenario")
+@click.option("-z", "--slow", is_flag=True, help="Run in slow mode")
+def main(pdf_path, debug, raw, json_output, slow):
+    """
+    Command-line interface entrypoint for the script. It takes a PDF file path
+    as input, orchestrates the scenario extraction, and saves the result to a
+    JSON file.
+    """
+    run_extraction(pdf_path, json_output=json_output, debug=debug, raw=raw, slow=slow)
+
 if __name__ == "__main__":
     # This makes the script executable from the command line.
     main()
\ No newline at end of file
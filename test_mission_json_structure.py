@@ -1,6 +1,5 @@
 import json
 from pathlib import Path
-from collections import Counter
 
 # Load the output JSON from your main script
 json_file = Path(__file__).parent / "its_scenarios.json"
@@ -98,9 +97,7 @@ def test_mission_structure(data):
             
             # Track section structure patterns
             key = f"{mission_type}:{section}:{struct_type}"
-            if key not in section_types:
-                section_types[key] = []
-            section_types[key].append(mission_name)
+            section_types.setdefault(key, []).append(mission_name)
         
         if mission_passed:
             print(f"✅ {mission_name}")
@@ -124,11 +121,7 @@ def test_mission_structure(data):
     structure_by_type = {}
     for key, missions in section_types.items():
         mission_type, section, struct_type = key.split(":")
-        if mission_type not in structure_by_type:
-            structure_by_type[mission_type] = {}
-        if section not in structure_by_type[mission_type]:
-            structure_by_type[mission_type][section] = {}
-        structure_by_type[mission_type][section][struct_type] = missions
+        structure_by_type.setdefault(mission_type, {}).setdefault(section, {})[struct_type] = missions
     
     for mission_type in sorted(structure_by_type.keys()):
         print(f"  {mission_type}:")